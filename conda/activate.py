@@ -18,6 +18,7 @@ import os
 import posixpath
 import re
 import sys
+from itertools import chain
 from logging import getLogger
 from os.path import (
     abspath,
@@ -32,7 +33,6 @@ from os.path import (
 from pathlib import Path
 from shutil import which
 from subprocess import run
-from textwrap import dedent
 from typing import TYPE_CHECKING
 
 # Since we have to have configuration context here, anything imported by
@@ -224,9 +224,7 @@ class _Activator(metaclass=abc.ABCMeta):
         # return value meant to be written to stdout
         # Hidden commands to provide metadata to shells.
         return "\n".join(
-            sorted(
-                find_builtin_commands(generate_parser()) + tuple(find_commands(True))
-            )
+            sorted(chain(find_builtin_commands(generate_parser()), find_commands(True)))
         )
 
     @abc.abstractmethod
@@ -1132,7 +1130,7 @@ class PosixActivator(_Activator):
             return
         current_prompt_modifier = os.getenv("CONDA_PROMPT_MODIFIER")
         if current_prompt_modifier:
-            ps1 = re.sub(re.escape(current_prompt_modifier), r"", ps1)
+            ps1 = ps1.replace(current_prompt_modifier, "")
         # Because we're using single-quotes to set shell variables, we need to handle the
         # proper escaping of single quotes that are already part of the string.
         # Best solution appears to be https://stackoverflow.com/a/1250279
@@ -1182,7 +1180,7 @@ class CshActivator(_Activator):
         prompt = os.getenv("prompt", "")
         current_prompt_modifier = os.getenv("CONDA_PROMPT_MODIFIER")
         if current_prompt_modifier:
-            prompt = re.sub(re.escape(current_prompt_modifier), r"", prompt)
+            prompt = prompt.replace(current_prompt_modifier, "")
         set_vars.update(
             {
                 "prompt": conda_prompt_modifier + prompt,
@@ -1191,23 +1189,23 @@ class CshActivator(_Activator):
 
     def _hook_preamble(self) -> str:
         if on_win:
-            return dedent(
-                f"""
-                setenv CONDA_EXE `cygpath {context.conda_exe}`
-                setenv _CONDA_ROOT `cygpath {context.conda_prefix}`
-                setenv _CONDA_EXE `cygpath {context.conda_exe}`
-                setenv CONDA_PYTHON_EXE `cygpath {sys.executable}`
-                """
-            ).strip()
+            return "\n".join(
+                (
+                    f"setenv CONDA_EXE `cygpath {context.conda_exe}`",
+                    f"setenv _CONDA_ROOT `cygpath {context.conda_prefix}`",
+                    f"setenv _CONDA_EXE `cygpath {context.conda_exe}`",
+                    f"setenv CONDA_PYTHON_EXE `cygpath {sys.executable}`",
+                )
+            )
         else:
-            return dedent(
-                f"""
-                setenv CONDA_EXE "{context.conda_exe}"
-                setenv _CONDA_ROOT "{context.conda_prefix}"
-                setenv _CONDA_EXE "{context.conda_exe}"
-                setenv CONDA_PYTHON_EXE "{sys.executable}"
-                """
-            ).strip()
+            return "\n".join(
+                (
+                    f'setenv CONDA_EXE "{context.conda_exe}"',
+                    f'setenv _CONDA_ROOT "{context.conda_prefix}"',
+                    f'setenv _CONDA_EXE "{context.conda_exe}"',
+                    f'setenv CONDA_PYTHON_EXE "{sys.executable}"',
+                )
+            )
 
 
 class XonshActivator(_Activator):
@@ -1284,23 +1282,23 @@ class FishActivator(_Activator):
 
     def _hook_preamble(self) -> str:
         if on_win:
-            return dedent(
-                f"""
-                set -gx CONDA_EXE (cygpath "{context.conda_exe}")
-                set _CONDA_ROOT (cygpath "{context.conda_prefix}")
-                set _CONDA_EXE (cygpath "{context.conda_exe}")
-                set -gx CONDA_PYTHON_EXE (cygpath "{sys.executable}")
-                """
-            ).strip()
+            return "\n".join(
+                (
+                    f'set -gx CONDA_EXE (cygpath "{context.conda_exe}")',
+                    f'set _CONDA_ROOT (cygpath "{context.conda_prefix}")',
+                    f'set _CONDA_EXE (cygpath "{context.conda_exe}")',
+                    f'set -gx CONDA_PYTHON_EXE (cygpath "{sys.executable}")',
+                )
+            )
         else:
-            return dedent(
-                f"""
-                set -gx CONDA_EXE "{context.conda_exe}"
-                set _CONDA_ROOT "{context.conda_prefix}"
-                set _CONDA_EXE "{context.conda_exe}"
-                set -gx CONDA_PYTHON_EXE "{sys.executable}"
-                """
-            ).strip()
+            return "\n".join(
+                (
+                    f'set -gx CONDA_EXE "{context.conda_exe}"',
+                    f'set _CONDA_ROOT "{context.conda_prefix}"',
+                    f'set _CONDA_EXE "{context.conda_exe}"',
+                    f'set -gx CONDA_PYTHON_EXE "{sys.executable}"',
+                )
+            )
 
 
 class PowerShellActivator(_Activator):
@@ -1325,28 +1323,28 @@ class PowerShellActivator(_Activator):
 
     def _hook_preamble(self) -> str:
         if context.dev:
-            return dedent(
-                f"""
-                $Env:PYTHONPATH = "{CONDA_SOURCE_ROOT}"
-                $Env:CONDA_EXE = "{sys.executable}"
-                $Env:_CE_M = "-m"
-                $Env:_CE_CONDA = "conda"
-                $Env:_CONDA_ROOT = "{CONDA_PACKAGE_ROOT}"
-                $Env:_CONDA_EXE = "{context.conda_exe}"
-                $CondaModuleArgs = @{{ChangePs1 = ${context.changeps1}}}
-                """
-            ).strip()
+            return "\n".join(
+                (
+                    f'$Env:PYTHONPATH = "{CONDA_SOURCE_ROOT}"',
+                    f'$Env:CONDA_EXE = "{sys.executable}"',
+                    '$Env:_CE_M = "-m"',
+                    '$Env:_CE_CONDA = "conda"',
+                    f'$Env:_CONDA_ROOT = "{CONDA_PACKAGE_ROOT}"',
+                    f'$Env:_CONDA_EXE = "{context.conda_exe}"',
+                    f"$CondaModuleArgs = @{{ChangePs1 = ${context.changeps1}}}",
+                )
+            )
         else:
-            return dedent(
-                f"""
-                $Env:CONDA_EXE = "{context.conda_exe}"
-                $Env:_CE_M = ""
-                $Env:_CE_CONDA = ""
-                $Env:_CONDA_ROOT = "{context.conda_prefix}"
-                $Env:_CONDA_EXE = "{context.conda_exe}"
-                $CondaModuleArgs = @{{ChangePs1 = ${context.changeps1}}}
-                """
-            ).strip()
+            return "\n".join(
+                (
+                    f'$Env:CONDA_EXE = "{context.conda_exe}"',
+                    '$Env:_CE_M = ""',
+                    '$Env:_CE_CONDA = ""',
+                    f'$Env:_CONDA_ROOT = "{context.conda_prefix}"',
+                    f'$Env:_CONDA_EXE = "{context.conda_exe}"',
+                    f"$CondaModuleArgs = @{{ChangePs1 = ${context.changeps1}}}",
+                )
+            )
 
     def _hook_postamble(self) -> str:
         return "Remove-Variable CondaModuleArgs"
@@ -13,8 +13,10 @@ from argparse import (
 )
 from argparse import ArgumentParser as ArgumentParserBase
 from importlib import import_module
+from itertools import chain
 from logging import getLogger
 from subprocess import Popen
+from typing import TYPE_CHECKING
 
 from .. import __version__
 from ..auxlib.compat import isiterable
@@ -45,25 +47,9 @@ from .helpers import (  # noqa: F401
     add_parser_update_modifiers,
     add_parser_verbose,
 )
-from .main_clean import configure_parser as configure_parser_clean
-from .main_compare import configure_parser as configure_parser_compare
-from .main_config import configure_parser as configure_parser_config
-from .main_create import configure_parser as configure_parser_create
-from .main_env import configure_parser as configure_parser_env
-from .main_export import configure_parser as configure_parser_export
-from .main_info import configure_parser as configure_parser_info
-from .main_init import configure_parser as configure_parser_init
-from .main_install import configure_parser as configure_parser_install
-from .main_list import configure_parser as configure_parser_list
-from .main_mock_activate import configure_parser as configure_parser_mock_activate
-from .main_mock_deactivate import configure_parser as configure_parser_mock_deactivate
-from .main_notices import configure_parser as configure_parser_notices
-from .main_package import configure_parser as configure_parser_package
-from .main_remove import configure_parser as configure_parser_remove
-from .main_rename import configure_parser as configure_parser_rename
-from .main_run import configure_parser as configure_parser_run
-from .main_search import configure_parser as configure_parser_search
-from .main_update import configure_parser as configure_parser_update
+
+if TYPE_CHECKING:
+    from typing import Any
 
 log = getLogger(__name__)
 
@@ -71,29 +57,75 @@ escaped_user_rc_path = user_rc_path.replace("%", "%%")
 escaped_sys_rc_path = sys_rc_path.replace("%", "%%")
 
 #: List of built-in commands; these cannot be overridden by plugin subcommands
-BUILTIN_COMMANDS = {
-    "activate",  # Mock entry for shell command
-    "clean",
-    "compare",
-    "config",
-    "create",
-    "deactivate",  # Mock entry for shell command
-    "export",
-    "info",
-    "init",
-    "install",
-    "list",
-    "package",
-    "remove",
-    "rename",
-    "run",
-    "search",
-    "update",
-    "upgrade",
-    "notices",
+BUILTIN_COMMANDS = frozenset(
+    {
+        "activate",  # Mock entry for shell command
+        "clean",
+        "compare",
+        "config",
+        "create",
+        "deactivate",  # Mock entry for shell command
+        "export",
+        "info",
+        "init",
+        "install",
+        "list",
+        "package",
+        "remove",
+        "rename",
+        "run",
+        "search",
+        "uninstall",  # Alias for remove
+        "update",
+        "upgrade",  # Alias for update
+        "notices",
+    }
+)
+
+_OVERRIDE_BUILTIN_ERROR = dals(
+    """
+    The {plugin} '{name}' is trying to override the built-in command
+    with the same name, which is not allowed.
+
+    Please uninstall the plugin to stop seeing this error message.
+    """
+)
+
+#: Modules (and subcommand aliases) for the built-in subcommands
+#: in the order they are registered; imported lazily since some of them are expensive
+#: to import and aren't needed unless the full parser is generated
+_BUILTIN_PARSERS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "mock_activate": (".main_mock_activate", ()),
+    "mock_deactivate": (".main_mock_deactivate", ()),
+    "clean": (".main_clean", ()),
+    "compare": (".main_compare", ()),
+    "config": (".main_config", ()),
+    "create": (".main_create", ()),
+    "env": (".main_env", ()),
+    "export": (".main_export", ()),
+    "info": (".main_info", ()),
+    "init": (".main_init", ()),
+    "install": (".main_install", ()),
+    "list": (".main_list", ()),
+    "notices": (".main_notices", ()),
+    "package": (".main_package", ()),
+    "remove": (".main_remove", ("uninstall",)),
+    "rename": (".main_rename", ()),
+    "run": (".main_run", ()),
+    "search": (".main_search", ()),
+    "update": (".main_update", ("upgrade",)),
 }
 
 
+def __getattr__(name: str) -> Any:
+    # backwards compatibility for the formerly eagerly imported `configure_parser_*`
+    if name.startswith("configure_parser_") and (
+        builtin := _BUILTIN_PARSERS.get(name[len("configure_parser_") :])
+    ):
+        return import_module(builtin[0], __package__).configure_parser
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
 def generate_pre_parser(**kwargs) -> ArgumentParser:
     pre_parser = ArgumentParser(
         description="conda is a tool for managing and deploying applications,"
@@ -138,25 +170,12 @@ def generate_parser(**kwargs) -> ArgumentParser:
         required=True,
     )
 
-    configure_parser_mock_activate(sub_parsers)
-    configure_parser_mock_deactivate(sub_parsers)
-    configure_parser_clean(sub_parsers)
-    configure_parser_compare(sub_parsers)
-    configure_parser_config(sub_parsers)
-    configure_parser_create(sub_parsers)
-    configure_parser_env(sub_parsers)
-    configure_parser_export(sub_parsers)
-    configure_parser_info(sub_parsers)
-    configure_parser_init(sub_parsers)
-    configure_parser_install(sub_parsers)
-    configure_parser_list(sub_parsers)
-    configure_parser_notices(sub_parsers)
-    configure_parser_package(sub_parsers)
-    configure_parser_remove(sub_parsers, aliases=["uninstall"])
-    configure_parser_rename(sub_parsers)
-    configure_parser_run(sub_parsers)
-    configure_parser_search(sub_parsers)
-    configure_parser_update(sub_parsers, aliases=["upgrade"])
+    for module_name, aliases in _BUILTIN_PARSERS.values():
+        configure_parser = import_module(module_name, __package__).configure_parser
+        if aliases:
+            configure_parser(sub_parsers, aliases=aliases)
+        else:
+            configure_parser(sub_parsers)
     configure_parser_plugins(sub_parsers)
 
     return parser
@@ -210,17 +229,45 @@ def find_builtin_commands(parser):
 
 class ArgumentParser(ArgumentParserBase):
     def __init__(self, *args, add_help=True, **kwargs):
+        # see add_argument and _get_formatter
+        self._validating_argument = False
+        self._validation_formatter = None
+
         kwargs.setdefault("formatter_class", RawDescriptionHelpFormatter)
         super().__init__(*args, add_help=False, **kwargs)
 
         if add_help:
             add_parser_help(self)
 
+    def add_argument(self, *args, **kwargs):
+        # argparse creates a new formatter (querying the terminal size each time) for
+        # every argument just to validate the metavar, reuse one formatter for that;
+        # this only covers arguments added directly to the parser, argparse skips the
+        # metavar check for arguments added to argument groups
+        self._validating_argument = True
+        try:
+            return super().add_argument(*args, **kwargs)
+        finally:
+            self._validating_argument = False
+
+    def _get_formatter(self, *args, **kwargs):
+        if not self._validating_argument:
+            return super()._get_formatter(*args, **kwargs)
+
+        if self._validation_formatter is None:
+            self._validation_formatter = super()._get_formatter(*args, **kwargs)
+        return self._validation_formatter
+
     def _check_value(self, action, value):
         # extend to properly handle when we accept multiple choices and the default is a list
         if action.choices is not None and isiterable(value):
-            for element in value:
-                super()._check_value(action, element)
+            # only defer to argparse for the first invalid element so it raises with
+            # the usual error message
+            invalid = next(
+                (element for element in value if element not in action.choices), NULL
+            )
+            if invalid is not NULL:
+                super()._check_value(action, invalid)
         else:
             super()._check_value(action, value)
 
@@ -268,7 +315,8 @@ def _exec(executable_args, env_vars):
 def _exec_win(executable_args, env_vars):
     p = Popen(executable_args, env=env_vars)
     try:
-        p.communicate()
+        # stdout/stderr are inherited, there is nothing to drain with communicate()
+        p.wait()
     except KeyboardInterrupt:
         p.wait()
     finally:
@@ -287,77 +335,64 @@ def configure_parser_plugins(sub_parsers) -> None:
     with the newly created subcommand specific argument parser.
     """
     plugin_subcommands = context.plugin_manager.get_subcommands()
-    for name, plugin_subcommand in plugin_subcommands.items():
+
+    # Ignore the legacy `conda-env` entrypoints since we already register `env`
+    # as a subcommand in `generate_parser` above
+    legacy = (
+        ()
+        if context.no_plugins
+        else set(find_commands()).difference(plugin_subcommands) - {"env"}
+    )
+
+    for name, plugin_subcommand in chain(
+        plugin_subcommands.items(), ((name, None) for name in legacy)
+    ):
         # if the name of the plugin-based subcommand overlaps a built-in
         # subcommand, we print an error
         if name in BUILTIN_COMMANDS:
             log.error(
-                dals(
-                    f"""
-                    The plugin '{name}' is trying to override the built-in command
-                    with the same name, which is not allowed.
-
-                    Please uninstall the plugin to stop seeing this error message.
-                    """
+                _OVERRIDE_BUILTIN_ERROR.format(
+                    plugin="plugin"
+                    if plugin_subcommand is not None
+                    else "(legacy) plugin",
+                    name=name,
                 )
             )
             continue
 
-        parser = sub_parsers.add_parser(
-            name,
-            description=plugin_subcommand.summary,
-            help=plugin_subcommand.summary,
-            add_help=False,  # defer to subcommand's help processing
-        )
-
-        # case 1: plugin extends the parser
-        if plugin_subcommand.configure_parser:
-            plugin_subcommand.configure_parser(parser)
-
-            # attempt to add standard help processing, will fail if plugin defines their own
-            try:
-                add_parser_help(parser)
-            except argparse.ArgumentError:
-                pass
-
-        # case 2: plugin has their own parser, see _GreedySubParsersAction
-        else:
-            parser.greedy = True
+        if plugin_subcommand is not None:
+            parser = sub_parsers.add_parser(
+                name,
+                description=plugin_subcommand.summary,
+                help=plugin_subcommand.summary,
+                add_help=False,  # defer to subcommand's help processing
+            )
 
-        # underscore prefixed indicating this is not a normal argparse argument
-        parser.set_defaults(_plugin_subcommand=plugin_subcommand)
+            # case 1: plugin extends the parser
+            if plugin_subcommand.configure_parser:
+                plugin_subcommand.configure_parser(parser)
 
-    if context.no_plugins:
-        return
+                # attempt to add standard help processing, will fail if plugin defines their own
+                try:
+                    add_parser_help(parser)
+                except argparse.ArgumentError:
+                    pass
 
-    # Ignore the legacy `conda-env` entrypoints since we already register `env`
-    # as a subcommand in `generate_parser` above
-    legacy = set(find_commands()).difference(plugin_subcommands) - {"env"}
+            # case 2: plugin has their own parser, see _GreedySubParsersAction
+            else:
+                parser.greedy = True
 
-    for name in legacy:
-        # if the name of the plugin-based subcommand overlaps a built-in
-        # subcommand, we print an error
-        if name in BUILTIN_COMMANDS:
-            log.error(
-                dals(
-                    f"""
-                    The (legacy) plugin '{name}' is trying to override the built-in command
-                    with the same name, which is not allowed.
-
-                    Please uninstall the plugin to stop seeing this error message.
-                    """
-                )
+            # underscore prefixed indicating this is not a normal argparse argument
+            parser.set_defaults(_plugin_subcommand=plugin_subcommand)
+        else:
+            parser = sub_parsers.add_parser(
+                name,
+                description=f"See `conda {name} --help`.",
+                help=f"See `conda {name} --help`.",
+                add_help=False,  # defer to subcommand's help processing
             )
-            continue
 
-        parser = sub_parsers.add_parser(
-            name,
-            description=f"See `conda {name} --help`.",
-            help=f"See `conda {name} --help`.",
-            add_help=False,  # defer to subcommand's help processing
-        )
-
-        # case 3: legacy plugins are always greedy
-        parser.greedy = True
+            # case 3: legacy plugins are always greedy
+            parser.greedy = True
 
-        parser.set_defaults(_executable=name)
+            parser.set_defaults(_executable=name)
@@ -70,6 +70,9 @@ def find_commands(include_others=True):
     for dir_path in dir_paths:
         try:
             for entry in os.scandir(dir_path):
+                # cheap prefix check before the regex, most PATH entries aren't conda-*
+                if not entry.name.startswith("conda-"):
+                    continue
                 m = pat.match(entry.name)
                 if m and entry.is_file():
                     res.add(m.group(1))
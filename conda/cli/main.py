@@ -107,7 +107,7 @@ def main_sourced(shell, *args, **kwargs):
         raise CondaError(f"{shell} is not a supported shell.")
 
     activator = activator_cls(args)
-    print(activator.execute(), end="")
+    sys.stdout.write(activator.execute())
     return 0
 
 
@@ -118,9 +118,10 @@ def main(*args, **kwargs):
 
     # cleanup argv
     args = args or sys.argv[1:]  # drop executable/script
-    args = tuple(ensure_text_type(s) for s in args)
+    # argv is already text on Python 3, only decode the odd bytes argument
+    args = tuple(s if isinstance(s, str) else ensure_text_type(s) for s in args)
 
-    if args and args[0].strip().startswith("shell."):
+    if args and args[0].startswith("shell."):
         main = main_sourced
     else:
         main = main_subshell
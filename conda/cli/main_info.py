@@ -295,18 +295,21 @@ def get_info_dict() -> dict[str, Any]:
         "LD_PRELOAD",
     }
 
-    # add all relevant env vars, e.g. startswith('CONDA') or endswith('PATH')
-    env_var_keys.update(v for v in os.environ if v.upper().startswith("CONDA"))
-    env_var_keys.update(v for v in os.environ if v.upper().startswith("PYTHON"))
-    env_var_keys.update(v for v in os.environ if v.upper().endswith("PATH"))
-    env_var_keys.update(v for v in os.environ if v.upper().startswith("SUDO"))
+    proxy_keys = set()
+
+    # add all relevant env vars, e.g. startswith('CONDA') or endswith('PATH'),
+    # in a single pass; proxies are masked since they may contain credentials
+    for key in os.environ:
+        upper = key.upper()
+        if upper.endswith("PROXY"):
+            proxy_keys.add(key)
+        elif upper.startswith(("CONDA", "PYTHON", "SUDO")) or upper.endswith("PATH"):
+            env_var_keys.add(key)
 
     env_vars = {
         ev: os.getenv(ev, os.getenv(ev.lower(), "<not set>")) for ev in env_var_keys
     }
-
-    proxy_keys = (v for v in os.environ if v.upper().endswith("PROXY"))
-    env_vars.update({ev: "<set>" for ev in proxy_keys})
+    env_vars.update(dict.fromkeys(proxy_keys, "<set>"))
 
     info_dict.update(
         {
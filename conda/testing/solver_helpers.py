@@ -4,9 +4,9 @@
 
 from __future__ import annotations
 
-import collections
 import functools
 import json
+import operator
 import pathlib
 from tempfile import TemporaryDirectory
 
@@ -26,12 +26,18 @@ from . import helpers
 
 
 @functools.lru_cache
-def index_packages(num):
-    """Get the index data of the ``helpers.get_index_r_*`` helpers."""
+def _index_packages(num):
     # XXX: get_index_r_X should probably be refactored to avoid loading the environment like this.
     get_index = getattr(helpers, f"get_index_r_{num}")
     index, _ = get_index(context.subdir)
-    return list(index.values())
+    return tuple(index.values())
+
+
+def index_packages(num):
+    """Get the index data of the ``helpers.get_index_r_*`` helpers."""
+    # the index is only loaded once, but tests extend the returned list in place
+    # (``env.repo_packages += [...]``) so hand out a fresh copy every time
+    return list(_index_packages(num))
 
 
 def package_string(record):
@@ -78,6 +84,9 @@ class SimpleEnvironment:
         # if it is a dictionary, it the keys are the channel name and the value
         # the channel packages
         self.repo_packages: list[str] | dict[str, list[str]] = []
+        # records last written to disk, to skip rewriting unchanged files
+        self._written_installed_packages: tuple = ()
+        self._written_repo_packages: dict[str, tuple] = {}
 
     def solver(self, add, remove):
         """Writes ``repo_packages`` to the disk and creates a solver instance."""
@@ -116,10 +125,9 @@ class SimpleEnvironment:
 
     def _package_data(self, record):
         """Turn record into data, to be written in the JSON environment/repo files."""
+        record_vars = vars(record)
         data = {
-            key: value
-            for key, value in vars(record).items()
-            if key in self.REPO_DATA_KEYS
+            key: record_vars[key] for key in self.REPO_DATA_KEYS if key in record_vars
         }
         if "subdir" not in data:
             data["subdir"] = context.subdir
@@ -128,6 +136,11 @@ class SimpleEnvironment:
     def _write_installed_packages(self):
         if not self.installed_packages:
             return
+        # skip if the exact same records were already written to the prefix
+        written = tuple(self.installed_packages)
+        previous = self._written_installed_packages
+        if len(previous) == len(written) and all(map(operator.is_, previous, written)):
+            return
         conda_meta = self._prefix_path / "conda-meta"
         conda_meta.mkdir(exist_ok=True, parents=True)
         # write record files
@@ -148,16 +161,27 @@ class SimpleEnvironment:
                 )
             )
         )
+        self._written_installed_packages = written
 
     def _write_repo_packages(self, channel_name, packages):
         """Write packages to the channel path."""
+        # skip if the exact same records were already written for this channel
+        written = (tuple(self.subdirs), tuple(packages))
+        previous = self._written_repo_packages.get(channel_name)
+        if (
+            previous is not None
+            and previous[0] == written[0]
+            and len(previous[1]) == len(written[1])
+            and all(map(operator.is_, previous[1], written[1]))
+        ):
+            return
         # build package data
-        package_data = collections.defaultdict(dict)
+        package_data = {subdir: {} for subdir in self.subdirs}
         for record in packages:
+            assert record.subdir in package_data
             package_data[record.subdir][record.fn] = self._package_data(record)
         # write repodata
-        assert set(self.subdirs).issuperset(set(package_data.keys()))
-        for subdir in self.subdirs:
+        for subdir, subdir_packages in package_data.items():
             subdir_path = self._channels_path / channel_name / subdir
             subdir_path.mkdir(parents=True, exist_ok=True)
             subdir_path.joinpath("repodata.json").write_text(
@@ -166,10 +190,11 @@ class SimpleEnvironment:
                         "info": {
                             "subdir": subdir,
                         },
-                        "packages": package_data.get(subdir, {}),
+                        "packages": subdir_packages,
                     }
                 )
             )
+        self._written_repo_packages[channel_name] = written
 
 
 def empty_prefix():
@@ -1046,10 +1071,6 @@ class SolverTests:
             env.install("a", "b")
         self.assert_unsatisfiable(exc_info, [("b", "c[version='>=2,<3']")])
 
-    @pytest.mark.xfail(
-        reason="There is some weird global state making "
-        "this test fail when the whole test suite is run"
-    )
     def test_remove(self, env):
         env.repo_packages = index_packages(1)
         records = env.install("pandas", "python 2.7*", as_specs=True)
@@ -8,7 +8,7 @@ from typing import Any, Callable
 
 import pytest
 
-from conda.cli.conda_argparse import generate_parser
+from conda.cli.conda_argparse import ArgumentParser, generate_parser
 from conda.exceptions import EnvironmentLocationNotFound
 from conda.testing import CondaCLIFixture
 
@@ -44,6 +44,26 @@ def test_parser_basics():
     assert args.verbosity == 2
 
 
+def test_parser_multiple_choices(capsys):
+    p = generate_parser()
+    args = p.parse_args(["init", "bash", "zsh"])
+    assert args.shells == ["bash", "zsh"]
+
+    with pytest.raises(SystemExit, match="2"):
+        p.parse_args(["init", "bash", "blarg", "zsh"])
+    assert "invalid choice: 'blarg'" in capsys.readouterr().err
+
+
+def test_parser_metavar_validation():
+    p = ArgumentParser()
+    p.add_argument("--foo", nargs=2, metavar=("A", "B"))
+    with pytest.raises(ValueError, match="length of metavar tuple"):
+        p.add_argument("--bar", nargs=2, metavar=("A", "B", "C"))
+
+    # the formatter reused for validation doesn't leak into help output
+    assert p.format_help().count("--foo A B") == 2
+
+
 def test_cli_args_as_strings(conda_cli: CondaCLIFixture):
     stdout, stderr, err = conda_cli("config", "--show", "add_anaconda_token")
     assert stdout
@@ -73,7 +93,10 @@ def test_cli_args_as_strings(conda_cli: CondaCLIFixture):
         ("conda.cli.conda_argparse.add_parser_verbose", isfunction),
         # derived from argparse.ArgumentParser
         ("conda.cli.conda_argparse.ArgumentParser", isclass),
-        ("conda.cli.conda_argparse.BUILTIN_COMMANDS", lambda x: isinstance(x, set)),
+        (
+            "conda.cli.conda_argparse.BUILTIN_COMMANDS",
+            lambda x: isinstance(x, frozenset),
+        ),
         ("conda.cli.conda_argparse.configure_parser_clean", isfunction),
         ("conda.cli.conda_argparse.configure_parser_compare", isfunction),
         ("conda.cli.conda_argparse.configure_parser_config", isfunction),
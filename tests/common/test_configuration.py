@@ -1,15 +1,15 @@
 # Copyright (C) 2012 Anaconda, Inc
 # SPDX-License-Identifier: BSD-3-Clause
-from os import environ
+from __future__ import annotations
+
+from functools import lru_cache
 from os.path import expandvars
-from pathlib import Path
-from shutil import rmtree
-from tempfile import mkdtemp
 from types import SimpleNamespace
+from typing import TYPE_CHECKING
 from uuid import uuid4
 
 import pytest
-from pytest import MonkeyPatch, raises
+from pytest import raises
 
 from conda.auxlib.ish import dals
 from conda.common.compat import on_win
@@ -36,6 +36,11 @@ from conda.common.configuration import (
 from conda.common.io import env_var, env_vars
 from conda.common.serialize import yaml_round_trip_load
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest import MonkeyPatch
+
 test_yaml_raw = {
     "file1": dals(
         """
@@ -315,12 +320,14 @@ class SampleConfiguration(Configuration):
     test_object = ParameterLoader(ObjectParameter(DummyTestObject()))
 
 
+@lru_cache(maxsize=None)
+def load_from_string(name):
+    return yaml_round_trip_load(test_yaml_raw[name])
+
+
 def load_from_string_data(*seq):
     return {
-        f: YamlRawParameter.make_raw_parameters(
-            f, yaml_round_trip_load(test_yaml_raw[f])
-        )
-        for f in seq
+        f: YamlRawParameter.make_raw_parameters(f, load_from_string(f)) for f in seq
     }
 
 
@@ -355,139 +362,90 @@ def test_default_values():
     assert config.changeps1 is True
 
 
-def test_env_var_config():
-    def make_key(appname, key):
-        return f"{appname.upper()}_{key.upper()}"
+def make_key(appname, key):
+    return f"{appname.upper()}_{key.upper()}"
 
-    appname = "myapp"
-    test_dict = {}
-    test_dict[make_key(appname, "always_yes")] = "yes"
-    test_dict[make_key(appname, "changeps1")] = "false"
 
-    try:
-        environ.update(test_dict)
-        assert "MYAPP_ALWAYS_YES" in environ
-        config = SampleConfiguration(app_name=appname)
-        assert config.changeps1 is False
-        assert config.always_yes is True
-    finally:
-        [environ.pop(key) for key in test_dict]
+def test_env_var_config(monkeypatch: MonkeyPatch):
+    appname = "myapp"
+    monkeypatch.setenv(make_key(appname, "always_yes"), "yes")
+    monkeypatch.setenv(make_key(appname, "changeps1"), "false")
 
+    config = SampleConfiguration(app_name=appname)
+    assert config.changeps1 is False
+    assert config.always_yes is True
 
-def test_env_var_config_alias():
-    def make_key(appname, key):
-        return f"{appname.upper()}_{key.upper()}"
 
+def test_env_var_config_alias(monkeypatch: MonkeyPatch):
     appname = "myapp"
-    test_dict = {}
-    test_dict[make_key(appname, "yes")] = "yes"
-    test_dict[make_key(appname, "changeps1")] = "false"
-
-    try:
-        environ.update(test_dict)
-        assert "MYAPP_YES" in environ
-        config = SampleConfiguration()._set_env_vars(appname)
-        assert config.always_yes is True
-        assert config.changeps1 is False
-    finally:
-        [environ.pop(key) for key in test_dict]
+    monkeypatch.setenv(make_key(appname, "yes"), "yes")
+    monkeypatch.setenv(make_key(appname, "changeps1"), "false")
 
+    config = SampleConfiguration()._set_env_vars(appname)
+    assert config.always_yes is True
+    assert config.changeps1 is False
 
-def test_env_var_config_split_sequence():
-    def make_key(appname, key):
-        return f"{appname.upper()}_{key.upper()}"
 
+def test_env_var_config_split_sequence(monkeypatch: MonkeyPatch):
     appname = "myapp"
-    test_dict = {}
-    test_dict[make_key(appname, "channels")] = "channel1,channel2"
+    monkeypatch.setenv(make_key(appname, "channels"), "channel1,channel2")
 
-    try:
-        environ.update(test_dict)
-        assert "MYAPP_CHANNELS" in environ
-        config = SampleConfiguration()._set_env_vars(appname)
-        assert config.channels == ("channel1", "channel2")
-    finally:
-        [environ.pop(key) for key in test_dict]
+    config = SampleConfiguration()._set_env_vars(appname)
+    assert config.channels == ("channel1", "channel2")
 
 
-def test_env_var_config_no_split_sequence():
-    def make_key(appname, key):
-        return f"{appname.upper()}_{key.upper()}"
+def test_env_var_config_no_split_sequence(monkeypatch: MonkeyPatch):
+    appname = "myapp"
+    monkeypatch.setenv(make_key(appname, "channels"), "channel1")
+
+    config = SampleConfiguration()._set_env_vars(appname)
+    assert config.channels == ("channel1",)
+
 
+def test_env_var_config_empty_sequence(monkeypatch: MonkeyPatch):
     appname = "myapp"
-    test_dict = {}
-    test_dict[make_key(appname, "channels")] = "channel1"
+    monkeypatch.setenv(make_key(appname, "channels"), "")
 
-    try:
-        environ.update(test_dict)
-        assert "MYAPP_CHANNELS" in environ
-        config = SampleConfiguration()._set_env_vars(appname)
-        assert config.channels == ("channel1",)
-    finally:
-        [environ.pop(key) for key in test_dict]
+    config = SampleConfiguration()._set_env_vars(appname)
+    assert config.channels == ()
 
 
-def test_env_var_config_empty_sequence():
-    def make_key(appname, key):
-        return f"{appname.upper()}_{key.upper()}"
+def test_load_raw_configs(tmp_path: Path):
+    condarc = tmp_path / ".condarc"
+    condarcd = tmp_path / "condarc.d"
+    f1 = condarcd / "file1.yml"
+    f2 = condarcd / "file2.yml"
+    not_a_file = tmp_path / "not_a_file"
 
-    appname = "myapp"
-    test_dict = {}
-    test_dict[make_key(appname, "channels")] = ""
+    condarcd.mkdir(exist_ok=True, parents=True)
 
-    try:
-        environ.update(test_dict)
-        assert "MYAPP_CHANNELS" in environ
-        config = SampleConfiguration()._set_env_vars(appname)
-        assert config.channels == ()
-    finally:
-        [environ.pop(key) for key in test_dict]
+    f1.write_text(test_yaml_raw["file1"])
+    f2.write_text(test_yaml_raw["file2"])
+    condarc.write_text(test_yaml_raw["file3"])
 
+    search_path = [condarc, not_a_file, condarcd]
 
-def test_load_raw_configs():
-    try:
-        tempdir = Path(mkdtemp()).resolve()
-        condarc = tempdir / ".condarc"
-        condarcd = tempdir / "condarc.d"
-        f1 = condarcd / "file1.yml"
-        f2 = condarcd / "file2.yml"
-        not_a_file = tempdir / "not_a_file"
-
-        condarcd.mkdir(exist_ok=True, parents=True)
-
-        f1.write_text(test_yaml_raw["file1"])
-        f2.write_text(test_yaml_raw["file2"])
-        condarc.write_text(test_yaml_raw["file3"])
-
-        search_path = [condarc, not_a_file, condarcd]
-
-        raw_data = load_file_configs(search_path)
-        assert condarc in raw_data
-        assert not_a_file not in raw_data
-        assert f1 in raw_data
-        assert f2 in raw_data
-        assert raw_data[condarc]["channels"].value(None)[0].value(None) == "wile"
-        assert raw_data[f1]["always_yes"].value(None) == "no"
-        assert raw_data[f2]["proxy_servers"].value(None)["http"].value(None) == "marv"
-
-        config = SampleConfiguration(search_path)
-
-        from pprint import pprint
-
-        for key, val in config.collect_all().items():
-            print(key)
-            pprint(val)
-        assert config.channels == (
-            "wile",
-            "porky",
-            "bugs",
-            "elmer",
-            "daffy",
-            "tweety",
-            "foghorn",
-        )
-    finally:
-        rmtree(tempdir, ignore_errors=True)
+    raw_data = load_file_configs(search_path)
+    assert condarc in raw_data
+    assert not_a_file not in raw_data
+    assert f1 in raw_data
+    assert f2 in raw_data
+    assert raw_data[condarc]["channels"].value(None)[0].value(None) == "wile"
+    assert raw_data[f1]["always_yes"].value(None) == "no"
+    assert raw_data[f2]["proxy_servers"].value(None)["http"].value(None) == "marv"
+
+    config = SampleConfiguration(search_path)
+
+    assert config.collect_all().keys() == {condarc, f1, f2}
+    assert config.channels == (
+        "wile",
+        "porky",
+        "bugs",
+        "elmer",
+        "daffy",
+        "tweety",
+        "foghorn",
+    )
 
 
 def test_important_primitive_map_merges():
@@ -560,55 +518,43 @@ def test_important_primitive_map_merges():
     assert config.proxy_servers == {"http": "bugs", "https": "daffy"}
 
 
-def test_list_merges():
-    raw_data = load_from_string_data("file5", "file3")
-    config = SampleConfiguration()._set_raw_data(raw_data)
-    assert config.channels == ("marv", "wile", "daffy", "foghorn", "pepé", "sam")
-
-    raw_data = load_from_string_data("file6", "file5", "file4", "file3")
-    config = SampleConfiguration()._set_raw_data(raw_data)
-    assert config.channels == ("pepé", "sam", "elmer", "bugs", "marv")
-
-    raw_data = load_from_string_data("file3", "file4", "file5", "file6")
-    config = SampleConfiguration()._set_raw_data(raw_data)
-    assert config.channels == ("wile", "pepé", "marv", "sam", "daffy", "foghorn")
-
-    raw_data = load_from_string_data("file6", "file3", "file4", "file5")
-    config = SampleConfiguration()._set_raw_data(raw_data)
-    assert config.channels == (
-        "wile",
-        "pepé",
-        "sam",
-        "daffy",
-        "foghorn",
-        "elmer",
-        "bugs",
-        "marv",
-    )
-
-    raw_data = load_from_string_data("file7", "file8", "file9")
-    config = SampleConfiguration()._set_raw_data(raw_data)
-    assert config.channels == ("sam", "marv", "wile", "foghorn", "daffy", "pepé")
-
-    raw_data = load_from_string_data("file7", "file9", "file8")
-    config = SampleConfiguration()._set_raw_data(raw_data)
-    assert config.channels == ("sam", "marv", "pepé", "wile", "foghorn", "daffy")
-
-    raw_data = load_from_string_data("file8", "file7", "file9")
-    config = SampleConfiguration()._set_raw_data(raw_data)
-    assert config.channels == ("marv", "sam", "wile", "foghorn", "daffy", "pepé")
-
-    raw_data = load_from_string_data("file8", "file9", "file7")
-    config = SampleConfiguration()._set_raw_data(raw_data)
-    assert config.channels == ("marv", "sam", "wile", "daffy", "pepé")
-
-    raw_data = load_from_string_data("file9", "file7", "file8")
-    config = SampleConfiguration()._set_raw_data(raw_data)
-    assert config.channels == ("marv", "sam", "pepé", "daffy")
-
-    raw_data = load_from_string_data("file9", "file8", "file7")
+@pytest.mark.parametrize(
+    "files,channels",
+    [
+        (("file5", "file3"), ("marv", "wile", "daffy", "foghorn", "pepé", "sam")),
+        (
+            ("file6", "file5", "file4", "file3"),
+            ("pepé", "sam", "elmer", "bugs", "marv"),
+        ),
+        (
+            ("file3", "file4", "file5", "file6"),
+            ("wile", "pepé", "marv", "sam", "daffy", "foghorn"),
+        ),
+        (
+            ("file6", "file3", "file4", "file5"),
+            ("wile", "pepé", "sam", "daffy", "foghorn", "elmer", "bugs", "marv"),
+        ),
+        (
+            ("file7", "file8", "file9"),
+            ("sam", "marv", "wile", "foghorn", "daffy", "pepé"),
+        ),
+        (
+            ("file7", "file9", "file8"),
+            ("sam", "marv", "pepé", "wile", "foghorn", "daffy"),
+        ),
+        (
+            ("file8", "file7", "file9"),
+            ("marv", "sam", "wile", "foghorn", "daffy", "pepé"),
+        ),
+        (("file8", "file9", "file7"), ("marv", "sam", "wile", "daffy", "pepé")),
+        (("file9", "file7", "file8"), ("marv", "sam", "pepé", "daffy")),
+        (("file9", "file8", "file7"), ("marv", "sam", "pepé", "daffy")),
+    ],
+)
+def test_list_merges(files: tuple[str, ...], channels: tuple[str, ...]):
+    raw_data = load_from_string_data(*files)
     config = SampleConfiguration()._set_raw_data(raw_data)
-    assert config.channels == ("marv", "sam", "pepé", "daffy")
+    assert config.channels == channels
 
 
 def test_validation():